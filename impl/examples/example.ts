@@ -6,9 +6,25 @@
 
 import * as net from 'net';
 import { WebSocket } from 'ws';
-import { MitchMessage, MitchHeader, Trade, Index, MessageType, packMitchMessage, unpackMitchMessage } from '../mitch';
+import {
+    MitchMessage, MitchHeader, Trade, Index, MessageType, MESSAGE_SIZES,
+    messageSizeFromHeader, packMitchMessage, packTradeMessage, unpackMitchMessage
+} from '../typescript/mitch';
+
+// Scatter-gather TCP write: corked writes are flushed on uncork as a single
+// writev() syscall, so several packed messages go out without concatenation.
+// Returns false when the socket buffer is full (wait for 'drain').
+function writeVec(socket: net.Socket, parts: Uint8Array[]): boolean {
+    socket.cork();
+    let ok = true;
+    for (const part of parts) {
+        ok = socket.write(part) && ok;
+    }
+    socket.uncork();
+    return ok;
+}
 
-// Example: Send Index message over TCP
+// Example: Send Index and Trade messages over TCP in one syscall
 async function sendIndexTcp(): Promise<void> {
     return new Promise((resolve, reject) => {
         const client = new net.Socket();
@@ -45,12 +61,23 @@ async function sendIndexTcp(): Promise<void> {
                 body: [index]
             };
 
-            // Serialize using reference implementation
-            const bytes = packMitchMessage(message);
-            client.write(bytes);
+            const trade: Trade = {
+                tickerId: 0x03006F301CD00000n, // EUR/USD
+                price: 1.08750,
+                quantity: 100000,
+                tradeId: 12345,
+                side: 0 // Buy
+            };
 
-            console.log(`Sent Index message successfully (${bytes.length} bytes)`);
-            client.destroy();
+            // Serialize using reference implementation
+            const parts = [
+                packMitchMessage(message),
+                packTradeMessage(header.timestamp, trade)
+            ];
+            writeVec(client, parts);
+
+            console.log(`Sent Index and Trade messages successfully (${parts[0].length + parts[1].length} bytes)`);
+            client.end();
             resolve();
         });
 
@@ -61,6 +88,78 @@ async function sendIndexTcp(): Promise<void> {
     });
 }
 
+// Per-connection streaming receiver. One 'data' chunk usually carries
+// several messages: complete ones are handed to `onMessage` straight out of
+// the chunk, and only a partial trailing message is copied into a buffer
+// that is reused for the life of the connection. Message views are valid
+// until the handler returns. Decoding errors destroy the socket, surfacing
+// through its 'error' event.
+class MitchConnection {
+    private buf = new Uint8Array(4096);
+    private filled = 0;
+
+    constructor(
+        readonly socket: net.Socket,
+        private readonly onMessage: (bytes: Uint8Array) => void
+    ) {
+        socket.on('data', (chunk: Buffer) => {
+            try {
+                this.receive(chunk);
+            } catch (error) {
+                socket.destroy(error as Error);
+            }
+        });
+    }
+
+    private receive(chunk: Uint8Array): void {
+        let pos = 0;
+
+        // Complete the message left pending by the previous chunk
+        if (this.filled > 0) {
+            pos = this.append(chunk, pos, MESSAGE_SIZES.HEADER);
+            if (this.filled < MESSAGE_SIZES.HEADER) return;
+            const size = messageSizeFromHeader(this.buf);
+            pos = this.append(chunk, pos, size);
+            if (this.filled < size) return;
+            this.onMessage(this.buf.subarray(0, size));
+            this.filled = 0;
+            if (this.socket.destroyed) return;
+        }
+
+        // Hand out every complete message without copying, stopping once a
+        // handler has torn the connection down
+        while (chunk.length - pos >= MESSAGE_SIZES.HEADER && !this.socket.destroyed) {
+            const size = messageSizeFromHeader(chunk, pos);
+            if (chunk.length - pos < size) break;
+            this.onMessage(chunk.subarray(pos, pos + size));
+            pos += size;
+        }
+
+        // Keep the partial trailing message for the next chunk
+        this.append(chunk, pos, chunk.length - pos);
+    }
+
+    // Copy bytes from `chunk` at `pos` until `target` bytes are buffered
+    private append(chunk: Uint8Array, pos: number, target: number): number {
+        const n = Math.min(target - this.filled, chunk.length - pos);
+        if (n <= 0) return pos;
+        this.reserve(this.filled + n);
+        this.buf.set(chunk.subarray(pos, pos + n), this.filled);
+        this.filled += n;
+        return pos + n;
+    }
+
+    // Grow only when a message outgrows the buffer: no steady-state allocation
+    private reserve(size: number): void {
+        if (size <= this.buf.length) return;
+        let capacity = this.buf.length * 2;
+        while (capacity < size) capacity *= 2;
+        const next = new Uint8Array(capacity);
+        next.set(this.buf.subarray(0, this.filled));
+        this.buf = next;
+    }
+}
+
 // Example: Receive messages over TCP
 async function receiveTcp(): Promise<void> {
     return new Promise((resolve, reject) => {
@@ -70,31 +169,26 @@ async function receiveTcp(): Promise<void> {
             console.log('Connected to TCP server, waiting for data...');
         });
 
-        client.on('data', (data) => {
-            try {
-                // Deserialize using reference implementation
-                const message = unpackMitchMessage(data);
-
-                console.log(`Received message type: ${String.fromCharCode(message.header.messageType)}, count: ${message.header.count}`);
-
-                if (message.header.messageType === MessageType.INDEX) {
-                    const indices = message.body as Index[];
-                    indices.forEach((index, i) => {
-                        console.log(`  Index ${i}: Ticker 0x${index.tickerId.toString(16)}, Mid: ${index.mid}`);
-                    });
-                } else if (message.header.messageType === MessageType.TRADE) {
-                    const trades = message.body as Trade[];
-                    trades.forEach((trade, i) => {
-                        console.log(`  Trade ${i}: Ticker 0x${trade.tickerId.toString(16)}, Price: ${trade.price}, Qty: ${trade.quantity}`);
-                    });
-                }
-
-                client.destroy();
-                resolve();
-            } catch (error) {
-                console.error('Error unpacking message:', error);
-                reject(error);
+        new MitchConnection(client, (bytes) => {
+            // Deserialize using reference implementation
+            const message = unpackMitchMessage(bytes);
+
+            console.log(`Received message type: ${String.fromCharCode(message.header.messageType)}, count: ${message.header.count}`);
+
+            if (message.header.messageType === MessageType.INDEX) {
+                const indices = message.body as Index[];
+                indices.forEach((index, i) => {
+                    console.log(`  Index ${i}: Ticker 0x${index.tickerId.toString(16)}, Mid: ${index.mid}`);
+                });
+            } else if (message.header.messageType === MessageType.TRADE) {
+                const trades = message.body as Trade[];
+                trades.forEach((trade, i) => {
+                    console.log(`  Trade ${i}: Ticker 0x${trade.tickerId.toString(16)}, Price: ${trade.price}, Qty: ${trade.quantity}`);
+                });
             }
+
+            client.destroy();
+            resolve();
         });
 
         client.on('error', (err) => {
@@ -111,11 +205,7 @@ async function sendTradeWebSocket(): Promise<void> {
 
         ws.on('open', () => {
             // Create trade message
-            const header: MitchHeader = {
-                messageType: MessageType.TRADE,
-                timestamp: 1234567890123456n,
-                count: 1
-            };
+            const timestamp = 1234567890123456n;
 
             const trade: Trade = {
                 tickerId: 0x03006F301CD00000n, // EUR/USD
@@ -125,13 +215,8 @@ async function sendTradeWebSocket(): Promise<void> {
                 side: 0 // Buy
             };
 
-            const message: MitchMessage = {
-                header,
-                body: [trade]
-            };
-
-            // Serialize using reference implementation
-            const bytes = packMitchMessage(message);
+            // Single-body message: header and trade packed in one buffer
+            const bytes = packTradeMessage(timestamp, trade);
             ws.send(bytes);
 
             console.log(`Sent Trade message via WebSocket successfully (${bytes.length} bytes)`);
@@ -157,8 +242,8 @@ async function subscribeWebSocket(): Promise<void> {
 
         ws.on('message', (data) => {
             try {
-                // Deserialize using reference implementation
-                const message = unpackMitchMessage(new Uint8Array(data as Buffer));
+                // Deserialize in place: the Buffer is decoded without copying
+                const message = unpackMitchMessage(data as Buffer);
 
                 console.log(`Received WebSocket message type: ${String.fromCharCode(message.header.messageType)}`);
 
@@ -190,7 +275,7 @@ async function main() {
     console.log('MITCH Protocol TypeScript Examples');
 
     try {
-        console.log('1. Sending Index over TCP');
+        console.log('1. Sending Index and Trade over TCP');
         await sendIndexTcp();
 
         console.log('2. Receiving messages over TCP');
@@ -107,26 +107,34 @@ export enum InstrumentType {
 /** MITCH unified message header (8 bytes) */
 export interface MitchHeader {
   messageType: number;  // u8: ASCII message type ('t', 'o', 's', 'b', 'i')
-  timestamp: Uint8Array; // u48: nanoseconds since midnight UTC (6 bytes)
+  timestamp: bigint;    // u48: nanoseconds since midnight UTC (6 bytes on the wire)
   count: number;        // u8: number of body entries (1-255)
 }
 
-/** Helper functions for timestamp conversion */
+/** Write a u48 in little-endian as one u32 + one u16 store */
+export function writeU48(dv: DataView, offset: number, value: bigint): void {
+  const n = Number(value & 0xFFFFFFFFFFFFn); // u48 is exact in a double
+  dv.setUint32(offset, n >>> 0, true);
+  dv.setUint16(offset + 4, Math.floor(n / 0x100000000), true);
+}
+
+/** Read a u48 in little-endian as one u32 + one u16 load */
+export function readU48(dv: DataView, offset: number): bigint {
+  return BigInt(dv.getUint16(offset + 4, true) * 0x100000000 + dv.getUint32(offset, true));
+}
+
+/** Helper functions for timestamp conversion to/from raw u48 bytes */
 export const TimestampUtils = {
   /** Convert u64 timestamp to u48 bytes */
   timestampToBytes(timestamp: bigint): Uint8Array {
-    const bytes = new Uint8Array(8);
-    const view = new DataView(bytes.buffer);
-    view.setBigUint64(0, timestamp, true); // little-endian
-    return bytes.slice(0, 6); // Take only first 6 bytes (u48)
+    const bytes = new Uint8Array(6);
+    writeU48(new DataView(bytes.buffer), 0, timestamp);
+    return bytes;
   },
 
   /** Convert u48 bytes to u64 timestamp */
   bytesToTimestamp(bytes: Uint8Array): bigint {
-    const fullBytes = new Uint8Array(8);
-    fullBytes.set(bytes.slice(0, 6)); // Copy 6 bytes, rest remain 0
-    const view = new DataView(fullBytes.buffer);
-    return view.getBigUint64(0, true); // little-endian
+    return readU48(new DataView(bytes.buffer, bytes.byteOffset, 6), 0);
   }
 };
 
@@ -189,7 +197,7 @@ export enum BinAggregator {
   DEFAULT_TRILINEAR = 3,    // Tri-linear for high volatility
 }
 
-/** Price level structure (8 bytes) */
+/** Price level structure (8 bytes), stored in OptimizedOrderBook as a u32 pair */
 export interface Bin {
   count: number;        // u32: number of standing orders in this bin
   volume: number;       // u32: total volume from mid to this bin boundary
@@ -201,10 +209,13 @@ export interface OptimizedOrderBook {
   midPrice: number;             // f64: current mid market price
   binAggregator: BinAggregator; // u8: aggregation method
   // 7 bytes padding
-  bids: Bin[];           // 128 fixed bid levels (1024 bytes)
-  asks: Bin[];           // 128 fixed ask levels (1024 bytes)
+  bids: Uint32Array;     // 128 bid levels as [count, volume] pairs (1024 bytes)
+  asks: Uint32Array;     // 128 ask levels as [count, volume] pairs (1024 bytes)
 }
 
+/** Number of bins per order book side */
+export const ORDER_BOOK_BINS = 128;
+
 // =============================================================================
 // CHANNEL ID SYSTEM
 // =============================================================================
@@ -357,8 +368,9 @@ export const MESSAGE_SIZES = {
   ORDER: 32,
   TICK: 32,
   INDEX: 64,          // Updated to 64
-  ORDER_BOOK_HEADER: 32,
-  ORDER_BOOK_VOLUME: 4,
+  ORDER_BOOK: 2072,
+  ORDER_BOOK_HEADER: 24,
+  BIN: 8,
 } as const;
 
 // =============================================================================
@@ -396,314 +408,786 @@ export const CHANNEL_EXAMPLES = {
 // SERIALIZATION AND DESERIALIZATION
 // =============================================================================
 
-// Complete packMitchMessage
-function packMitchMessage(msg: MitchMessage): Uint8Array {
-  const header = msg.header;
-  const type = header.messageType;
-  const count = header.count;
-  let totalSize = MESSAGE_SIZES.HEADER;
+/** Any binary input the decoders accept: Uint8Array/Buffer, DataView or ArrayBuffer */
+export type MitchBytes = ArrayBufferView | ArrayBufferLike;
 
-  switch (type) {
-    case MessageType.TRADE:
-    case MessageType.ORDER:
-    case MessageType.TICK:
-      totalSize += count * 32;
-      break;
-    case MessageType.INDEX:
-      totalSize += count * 64;
-      break;
-    case MessageType.ORDER_BOOK:
-      (msg.body as OptimizedOrderBook[]).forEach(ob => {
-        totalSize += MESSAGE_SIZES.ORDER_BOOK_HEADER + ob.bids.length * 8 + ob.asks.length * 8;
-      });
-      break;
-  }
-
-  const buffer = new Uint8Array(totalSize);
-  const dv = new DataView(buffer.buffer);
-  let offset = 0;
+/** DataView over the caller's memory (never a copy) */
+function viewOf(bytes: MitchBytes): DataView {
+  if (bytes instanceof DataView) return bytes;
+  if (ArrayBuffer.isView(bytes)) return new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  return new DataView(bytes);
+}
+
+/** Host byte order matches the wire (little-endian) */
+const HOST_LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+/**
+ * Whether bodies at `offset` can be read through typed-array casts instead of
+ * DataView calls (cast-only decoding, as in the Rust implementation).
+ * Requires a little-endian host and an 8-byte aligned body block.
+ */
+function canCast(dv: DataView, offset: number): boolean {
+  return HOST_LITTLE_ENDIAN && (dv.byteOffset + offset) % 8 === 0;
+}
+
+/**
+ * Throw the same RangeError a DataView access would when `length` bytes at
+ * `offset` fall outside the view. Typed-array casts are bounded only by the
+ * backing ArrayBuffer, so fast paths must check the view before casting.
+ */
+function checkBounds(dv: DataView, offset: number, length: number): void {
+  if (offset < 0 || offset + length > dv.byteLength) {
+    throw new RangeError('Offset is outside the bounds of the DataView');
+  }
+}
+
+// Per-layout codecs: each wire layout is defined once at module scope and
+// shared by every message packer/unpacker. Packers return the next offset.
+// Unpackers build every new body of a type from one object literal with the
+// interface's fields in declaration order, so all bodies they allocate share
+// a single fixed layout (hidden class). Bodies refilled from a pool keep the
+// layout of whatever object was released into it.
+
+// Body pools: consumers that are done with decoded bodies hand them back
+// with releaseTrades/releaseOrders/releaseTicks, and the unpackers refill
+// those objects in place instead of allocating. Released bodies must not be
+// read again, and releasing a body that is already pooled is ignored so it
+// is never handed out twice. Each pool keeps at most POOL_LIMIT objects.
+
+const POOL_LIMIT = 4096;
+const tradePool: Trade[] = [];
+const orderPool: Order[] = [];
+const tickPool: Tick[] = [];
+
+/** Bodies currently held by a pool, removed again when an unpacker reuses them */
+const pooled = new WeakSet<object>();
+
+function release<T extends object>(pool: T[], bodies: T[]): void {
+  for (let i = 0; i < bodies.length && pool.length < POOL_LIMIT; i++) {
+    const body = bodies[i];
+    if (pooled.has(body)) continue;
+    pooled.add(body);
+    pool.push(body);
+  }
+}
+
+/** Return decoded trades to the pool for reuse by unpackTrade; release each once */
+export function releaseTrades(trades: Trade[]): void {
+  release(tradePool, trades);
+}
+
+/** Return decoded orders to the pool for reuse by unpackOrder; release each once */
+export function releaseOrders(orders: Order[]): void {
+  release(orderPool, orders);
+}
 
-  // Pack header
-  dv.setUint8(offset, type);
+/** Return decoded ticks to the pool for reuse by unpackTick; release each once */
+export function releaseTicks(ticks: Tick[]): void {
+  release(tickPool, ticks);
+}
+
+/**
+ * Zero `length` padding bytes (at most 9). Bodies carry no padding fields:
+ * packers synthesize it, so buffers reused by packMitchMessageInto never
+ * leak stale bytes.
+ */
+function writePadding(dv: DataView, offset: number, length: number): void {
+  if (length & 1) dv.setUint8(offset + length - 1, 0);
+  if (length & 2) dv.setUint16(offset + (length & ~3), 0);
+  for (let i = 0; i + 4 <= length; i += 4) dv.setUint32(offset + i, 0);
+}
+
+/** Pack MITCH header (8 bytes) as two u32 stores: [type:8][timestamp:48][count:8] */
+export function packHeader(dv: DataView, offset: number, header: MitchHeader): number {
+  const ts = Number(header.timestamp & 0xFFFFFFFFFFFFn); // u48 is exact in a double
+  dv.setUint32(offset, (header.messageType | ((ts % 0x1000000) << 8)) >>> 0, true); // little-endian
+  dv.setUint32(offset + 4, (Math.floor(ts / 0x1000000) | (header.count << 24)) >>> 0, true); // little-endian
+  return offset + MESSAGE_SIZES.HEADER;
+}
+
+/** Unpack MITCH header (8 bytes) from two u32 loads */
+export function unpackHeader(dv: DataView, offset: number): MitchHeader {
+  const lo = dv.getUint32(offset, true); // little-endian
+  const hi = dv.getUint32(offset + 4, true); // little-endian
+  return {
+    messageType: lo & 0xFF,
+    timestamp: BigInt((hi & 0xFFFFFF) * 0x1000000 + (lo >>> 8)),
+    count: hi >>> 24
+  };
+}
+
+/** Pack Trade body (32 bytes) */
+export function packTrade(dv: DataView, offset: number, trade: Trade): number {
+  dv.setBigUint64(offset, trade.tickerId, true); // little-endian
+  offset += 8;
+  dv.setFloat64(offset, trade.price, true); // little-endian
+  offset += 8;
+  dv.setUint32(offset, trade.quantity, true); // little-endian
+  offset += 4;
+  dv.setUint32(offset, trade.tradeId, true); // little-endian
+  offset += 4;
+  dv.setUint8(offset, trade.side);
   offset += 1;
+  writePadding(dv, offset, 7);
+  return offset + 7;
+}
 
-  // Pack u48 timestamp in little-endian
-  const timestamp = header.timestamp;
-  dv.setUint8(offset, Number(timestamp & 0xFFn));
-  dv.setUint8(offset + 1, Number((timestamp >> 8n) & 0xFFn));
-  dv.setUint8(offset + 2, Number((timestamp >> 16n) & 0xFFn));
-  dv.setUint8(offset + 3, Number((timestamp >> 24n) & 0xFFn));
-  dv.setUint8(offset + 4, Number((timestamp >> 32n) & 0xFFn));
-  dv.setUint8(offset + 5, Number((timestamp >> 40n) & 0xFFn));
+/** Unpack Trade body (32 bytes), reusing a released Trade when available */
+export function unpackTrade(dv: DataView, offset: number): Trade {
+  const trade = tradePool.pop();
+  if (trade === undefined) {
+    return {
+      tickerId: dv.getBigUint64(offset, true), // little-endian
+      price: dv.getFloat64(offset + 8, true), // little-endian
+      quantity: dv.getUint32(offset + 16, true), // little-endian
+      tradeId: dv.getUint32(offset + 20, true), // little-endian
+      side: dv.getUint8(offset + 24)
+    };
+  }
+  pooled.delete(trade);
+  trade.tickerId = dv.getBigUint64(offset, true); // little-endian
+  trade.price = dv.getFloat64(offset + 8, true); // little-endian
+  trade.quantity = dv.getUint32(offset + 16, true); // little-endian
+  trade.tradeId = dv.getUint32(offset + 20, true); // little-endian
+  trade.side = dv.getUint8(offset + 24);
+  return trade;
+}
+
+/** Pack Order body (32 bytes) */
+export function packOrder(dv: DataView, offset: number, order: Order): number {
+  dv.setBigUint64(offset, order.tickerId, true); // little-endian
+  offset += 8;
+  dv.setUint32(offset, order.orderId, true); // little-endian
+  offset += 4;
+  dv.setFloat64(offset, order.price, true); // little-endian
+  offset += 8;
+  dv.setUint32(offset, order.quantity, true); // little-endian
+  offset += 4;
+  dv.setUint8(offset, order.typeAndSide);
+  offset += 1;
+  writeU48(dv, offset, order.expiry); // u48 expiry, little-endian
   offset += 6;
+  writePadding(dv, offset, 1);
+  return offset + 1;
+}
 
-  dv.setUint8(offset, count);
+/** Unpack Order body (32 bytes), reusing a released Order when available */
+export function unpackOrder(dv: DataView, offset: number): Order {
+  const order = orderPool.pop();
+  if (order === undefined) {
+    return {
+      tickerId: dv.getBigUint64(offset, true), // little-endian
+      orderId: dv.getUint32(offset + 8, true), // little-endian
+      price: dv.getFloat64(offset + 12, true), // little-endian
+      quantity: dv.getUint32(offset + 20, true), // little-endian
+      typeAndSide: dv.getUint8(offset + 24),
+      expiry: readU48(dv, offset + 25) // u48 expiry, little-endian
+    };
+  }
+  pooled.delete(order);
+  order.tickerId = dv.getBigUint64(offset, true); // little-endian
+  order.orderId = dv.getUint32(offset + 8, true); // little-endian
+  order.price = dv.getFloat64(offset + 12, true); // little-endian
+  order.quantity = dv.getUint32(offset + 20, true); // little-endian
+  order.typeAndSide = dv.getUint8(offset + 24);
+  order.expiry = readU48(dv, offset + 25); // u48 expiry, little-endian
+  return order;
+}
+
+/** Pack Tick body (32 bytes) */
+export function packTick(dv: DataView, offset: number, tick: Tick): number {
+  dv.setBigUint64(offset, tick.tickerId, true); // little-endian
+  offset += 8;
+  dv.setFloat64(offset, tick.bidPrice, true); // little-endian
+  offset += 8;
+  dv.setFloat64(offset, tick.askPrice, true); // little-endian
+  offset += 8;
+  dv.setUint32(offset, tick.bidVolume, true); // little-endian
+  offset += 4;
+  dv.setUint32(offset, tick.askVolume, true); // little-endian
+  offset += 4;
+  return offset;
+}
+
+/** Unpack Tick body (32 bytes), reusing a released Tick when available */
+export function unpackTick(dv: DataView, offset: number): Tick {
+  const tick = tickPool.pop();
+  if (tick === undefined) {
+    return {
+      tickerId: dv.getBigUint64(offset, true), // little-endian
+      bidPrice: dv.getFloat64(offset + 8, true), // little-endian
+      askPrice: dv.getFloat64(offset + 16, true), // little-endian
+      bidVolume: dv.getUint32(offset + 24, true), // little-endian
+      askVolume: dv.getUint32(offset + 28, true) // little-endian
+    };
+  }
+  pooled.delete(tick);
+  tick.tickerId = dv.getBigUint64(offset, true); // little-endian
+  tick.bidPrice = dv.getFloat64(offset + 8, true); // little-endian
+  tick.askPrice = dv.getFloat64(offset + 16, true); // little-endian
+  tick.bidVolume = dv.getUint32(offset + 24, true); // little-endian
+  tick.askVolume = dv.getUint32(offset + 28, true); // little-endian
+  return tick;
+}
+
+/** Pack Index body (64 bytes) */
+export function packIndex(dv: DataView, offset: number, index: Index): number {
+  dv.setBigUint64(offset, index.tickerId, true); // little-endian
+  offset += 8;
+  dv.setFloat64(offset, index.mid, true); // little-endian
+  offset += 8;
+  dv.setUint32(offset, index.vbid, true); // little-endian
+  offset += 4;
+  dv.setUint32(offset, index.vask, true); // little-endian
+  offset += 4;
+  dv.setInt32(offset, index.mspread, true); // little-endian
+  offset += 4;
+  dv.setInt32(offset, index.bbido, true); // little-endian
+  offset += 4;
+  dv.setInt32(offset, index.basko, true); // little-endian
+  offset += 4;
+  dv.setInt32(offset, index.wbido, true); // little-endian
+  offset += 4;
+  dv.setInt32(offset, index.wasko, true); // little-endian
+  offset += 4;
+  dv.setUint16(offset, index.vforce, true); // little-endian
+  offset += 2;
+  dv.setUint16(offset, index.lforce, true); // little-endian
+  offset += 2;
+  dv.setInt16(offset, index.tforce, true); // little-endian
+  offset += 2;
+  dv.setInt16(offset, index.mforce, true); // little-endian
+  offset += 2;
+  dv.setUint8(offset, index.confidence);
+  offset += 1;
+  dv.setUint8(offset, index.rejected);
   offset += 1;
+  dv.setUint8(offset, index.accepted);
+  offset += 1;
+  writePadding(dv, offset, 9);
+  return offset + 9;
+}
 
-  // Pack body based on type
-  switch (type) {
-    case MessageType.TRADE:
-      for (const trade of msg.body as Trade[]) {
-        dv.setBigUint64(offset, trade.tickerId, true); // little-endian
-        offset += 8;
-        dv.setFloat64(offset, trade.price, true); // little-endian
-        offset += 8;
-        dv.setUint32(offset, trade.quantity, true); // little-endian
-        offset += 4;
-        dv.setUint32(offset, trade.tradeId, true); // little-endian
-        offset += 4;
-        dv.setUint8(offset, trade.side);
-        offset += 1;
-        offset += 7; // padding
-      }
-      break;
+/** Unpack Index body (64 bytes) */
+export function unpackIndex(dv: DataView, offset: number): Index {
+  return {
+    tickerId: dv.getBigUint64(offset, true), // little-endian
+    mid: dv.getFloat64(offset + 8, true), // little-endian
+    vbid: dv.getUint32(offset + 16, true), // little-endian
+    vask: dv.getUint32(offset + 20, true), // little-endian
+    mspread: dv.getInt32(offset + 24, true), // little-endian
+    bbido: dv.getInt32(offset + 28, true), // little-endian
+    basko: dv.getInt32(offset + 32, true), // little-endian
+    wbido: dv.getInt32(offset + 36, true), // little-endian
+    wasko: dv.getInt32(offset + 40, true), // little-endian
+    vforce: dv.getUint16(offset + 44, true), // little-endian
+    lforce: dv.getUint16(offset + 46, true), // little-endian
+    tforce: dv.getInt16(offset + 48, true), // little-endian
+    mforce: dv.getInt16(offset + 50, true), // little-endian
+    confidence: dv.getUint8(offset + 52),
+    rejected: dv.getUint8(offset + 53),
+    accepted: dv.getUint8(offset + 54)
+  };
+}
 
-    case MessageType.ORDER:
-      for (const order of msg.body as Order[]) {
-        dv.setBigUint64(offset, order.tickerId, true); // little-endian
-        offset += 8;
-        dv.setUint32(offset, order.orderId, true); // little-endian
-        offset += 4;
-        dv.setFloat64(offset, order.price, true); // little-endian
-        offset += 8;
-        dv.setUint32(offset, order.quantity, true); // little-endian
-        offset += 4;
-        const typeAndSide = (order.orderType << 1) | order.side;
-        dv.setUint8(offset, typeAndSide);
-        offset += 1;
-        // Pack u48 expiry in little-endian
-        const expiry = order.expiry;
-        dv.setUint8(offset, Number(expiry & 0xFFn));
-        dv.setUint8(offset + 1, Number((expiry >> 8n) & 0xFFn));
-        dv.setUint8(offset + 2, Number((expiry >> 16n) & 0xFFn));
-        dv.setUint8(offset + 3, Number((expiry >> 24n) & 0xFFn));
-        dv.setUint8(offset + 4, Number((expiry >> 32n) & 0xFFn));
-        dv.setUint8(offset + 5, Number((expiry >> 40n) & 0xFFn));
-        offset += 6;
-        offset += 1; // padding
-      }
-      break;
+/** Pack order book bins: (count, volume) u32 pairs, bulk-copied when possible */
+function packBins(dv: DataView, offset: number, bins: Uint32Array): number {
+  if (bins.length !== ORDER_BOOK_BINS * 2) {
+    throw new Error(`Order book side must have ${ORDER_BOOK_BINS * 2} u32 values, got ${bins.length}`);
+  }
+  checkBounds(dv, offset, bins.length * 4);
+  if (canCast(dv, offset)) {
+    new Uint32Array(dv.buffer, dv.byteOffset + offset, bins.length).set(bins);
+    return offset + bins.length * 4;
+  }
+  for (let j = 0; j < bins.length; j++, offset += 4) {
+    dv.setUint32(offset, bins[j], true); // little-endian
+  }
+  return offset;
+}
 
-    case MessageType.TICK:
-      for (const tick of msg.body as Tick[]) {
-        dv.setBigUint64(offset, tick.tickerId, true); // little-endian
-        offset += 8;
-        dv.setFloat64(offset, tick.bidPrice, true); // little-endian
-        offset += 8;
-        dv.setFloat64(offset, tick.askPrice, true); // little-endian
-        offset += 8;
-        dv.setUint32(offset, tick.bidVolume, true); // little-endian
-        offset += 4;
-        dv.setUint32(offset, tick.askVolume, true); // little-endian
-        offset += 4;
-      }
-      break;
-
-    case MessageType.ORDER_BOOK:
-      for (const orderBook of msg.body as OptimizedOrderBook[]) {
-        dv.setBigUint64(offset, orderBook.tickerId, true); // little-endian
-        offset += 8;
-        dv.setFloat64(offset, orderBook.midPrice, true); // little-endian
-        offset += 8;
-        dv.setUint8(offset, orderBook.binAggregator); // little-endian
-        offset += 1;
-        offset += 7; // padding
-
-        for (const bid of orderBook.bids) {
-          dv.setUint32(offset, bid.count, true); // little-endian
-          offset += 4;
-          dv.setUint32(offset, bid.volume, true); // little-endian
-          offset += 4;
-        }
-
-        for (const ask of orderBook.asks) {
-          dv.setUint32(offset, ask.count, true); // little-endian
-          offset += 4;
-          dv.setUint32(offset, ask.volume, true); // little-endian
-          offset += 4;
-        }
-      }
-      break;
-
-    case MessageType.INDEX:
-      for (const index of msg.body as Index[]) {
-        dv.setBigUint64(offset, index.tickerId, true); // little-endian
-        offset += 8;
-        dv.setFloat64(offset, index.mid, true); // little-endian
-        offset += 8;
-        dv.setUint32(offset, index.vbid, true); // little-endian
-        offset += 4;
-        dv.setUint32(offset, index.vask, true); // little-endian
-        offset += 4;
-        dv.setInt32(offset, index.mspread, true); // little-endian
-        offset += 4;
-        dv.setInt32(offset, index.bbido, true); // little-endian
-        offset += 4;
-        dv.setInt32(offset, index.basko, true); // little-endian
-        offset += 4;
-        dv.setInt32(offset, index.wbido, true); // little-endian
-        offset += 4;
-        dv.setInt32(offset, index.wasko, true); // little-endian
-        offset += 4;
-        dv.setUint16(offset, index.vforce, true); // little-endian
-        offset += 2;
-        dv.setUint16(offset, index.lforce, true); // little-endian
-        offset += 2;
-        dv.setInt16(offset, index.tforce, true); // little-endian
-        offset += 2;
-        dv.setInt16(offset, index.mforce, true); // little-endian
-        offset += 2;
-        dv.setUint8(offset, index.confidence);
-        offset += 1;
-        dv.setUint8(offset, index.rejected);
-        offset += 1;
-        dv.setUint8(offset, index.accepted);
-        offset += 1;
-        offset += 9; // padding
-      }
-      break;
+/** Unpack one order book side of (count, volume) u32 pairs into its own array */
+function unpackBins(dv: DataView, offset: number): Uint32Array {
+  const bins = new Uint32Array(ORDER_BOOK_BINS * 2);
+  checkBounds(dv, offset, bins.length * 4);
+  if (canCast(dv, offset)) {
+    bins.set(new Uint32Array(dv.buffer, dv.byteOffset + offset, bins.length));
+    return bins;
+  }
+  for (let j = 0; j < bins.length; j++, offset += 4) {
+    bins[j] = dv.getUint32(offset, true); // little-endian
+  }
+  return bins;
+}
+
+/** Pack OrderBook body */
+export function packOrderBook(dv: DataView, offset: number, orderBook: OptimizedOrderBook): number {
+  dv.setBigUint64(offset, orderBook.tickerId, true); // little-endian
+  offset += 8;
+  dv.setFloat64(offset, orderBook.midPrice, true); // little-endian
+  offset += 8;
+  dv.setUint8(offset, orderBook.binAggregator); // little-endian
+  offset += 1;
+  writePadding(dv, offset, 7);
+  offset += 7;
+
+  offset = packBins(dv, offset, orderBook.bids);
+  return packBins(dv, offset, orderBook.asks);
+}
+
+/** Unpack OrderBook body */
+export function unpackOrderBook(dv: DataView, offset: number): OptimizedOrderBook {
+  const tickerId = dv.getBigUint64(offset, true); // little-endian
+  const midPrice = dv.getFloat64(offset + 8, true); // little-endian
+  const binAggregator = dv.getUint8(offset + 16); // little-endian
+  offset += MESSAGE_SIZES.ORDER_BOOK_HEADER;
+
+  const bids = unpackBins(dv, offset);
+  const asks = unpackBins(dv, offset + ORDER_BOOK_BINS * MESSAGE_SIZES.BIN);
+
+  return {
+    tickerId,
+    midPrice,
+    binAggregator,
+    bids,
+    asks
+  };
+}
+
+/** Wire size and codecs of one body type */
+interface BodyCodec {
+  size: number;
+  pack: (dv: DataView, offset: number, body: any) => number;
+  unpack: (dv: DataView, offset: number) => any;
+}
+
+/** Body codecs by message type: one lookup replaces per-type branching */
+const BODY_CODECS: Record<number, BodyCodec> = {
+  [MessageType.TRADE]: { size: MESSAGE_SIZES.TRADE, pack: packTrade, unpack: unpackTrade },
+  [MessageType.ORDER]: { size: MESSAGE_SIZES.ORDER, pack: packOrder, unpack: unpackOrder },
+  [MessageType.TICK]: { size: MESSAGE_SIZES.TICK, pack: packTick, unpack: unpackTick },
+  [MessageType.INDEX]: { size: MESSAGE_SIZES.INDEX, pack: packIndex, unpack: unpackIndex },
+  [MessageType.ORDER_BOOK]: { size: MESSAGE_SIZES.ORDER_BOOK, pack: packOrderBook, unpack: unpackOrderBook },
+};
+
+function bodyCodec(messageType: number): BodyCodec {
+  const codec = BODY_CODECS[messageType];
+  if (codec === undefined) {
+    throw new Error(`Invalid message type: ${messageType}`);
   }
+  return codec;
+}
 
+/** Size in bytes of a single body for a message type */
+export function bodySize(messageType: number): number {
+  return bodyCodec(messageType).size;
+}
+
+/** Total message size read from its 8-byte header, before the body arrives */
+export function messageSizeFromHeader(bytes: Uint8Array, offset: number = 0): number {
+  return MESSAGE_SIZES.HEADER + bytes[offset + 7] * bodySize(bytes[offset]);
+}
+
+/** Serialized size of a MITCH message in bytes */
+export function mitchMessageSize(msg: MitchMessage): number {
+  return MESSAGE_SIZES.HEADER + msg.header.count * bodySize(msg.header.messageType);
+}
+
+/**
+ * Pack a MITCH message into a caller-provided buffer at `offset`.
+ * Lets producers reuse one send buffer across messages; `out` must have
+ * room for mitchMessageSize(msg) bytes. Returns the offset past the message.
+ */
+export function packMitchMessageInto(msg: MitchMessage, out: Uint8Array, offset: number = 0): number {
+  if (msg.body.length !== msg.header.count) {
+    throw new Error(`Header count ${msg.header.count} does not match ${msg.body.length} bodies`);
+  }
+  const codec = bodyCodec(msg.header.messageType);
+  const size = MESSAGE_SIZES.HEADER + msg.header.count * codec.size;
+  if (out.byteLength - offset < size) {
+    throw new Error(`Buffer too small: expected ${size} bytes, got ${out.byteLength - offset}`);
+  }
+  const dv = new DataView(out.buffer, out.byteOffset, out.byteLength);
+  offset = packHeader(dv, offset, msg.header);
+  for (const body of msg.body) {
+    offset = codec.pack(dv, offset, body);
+  }
+
+  return offset;
+}
+
+/** Pack a MITCH message into a newly allocated buffer of the exact size */
+export function packMitchMessage(msg: MitchMessage): Uint8Array {
+  const buffer = new Uint8Array(mitchMessageSize(msg));
+  packMitchMessageInto(msg, buffer);
   return buffer;
 }
 
-// Complete the unpack
-function unpackMitchMessage(bytes: Uint8Array): MitchMessage {
-  const dv = new DataView(bytes.buffer);
-  let offset = 0;
+// Single-body messages: header and body are packed into one exact-size
+// buffer, skipping message sizing and type dispatch. The header's type and
+// count are fixed by the packer, so only the timestamp is taken.
+
+function packSingle<T>(
+  messageType: number,
+  timestamp: bigint,
+  body: T,
+  size: number,
+  pack: (dv: DataView, offset: number, body: T) => number
+): Uint8Array {
+  const buffer = new Uint8Array(MESSAGE_SIZES.HEADER + size);
+  const dv = new DataView(buffer.buffer);
+  pack(dv, packHeader(dv, 0, { messageType, timestamp, count: 1 }), body);
+  return buffer;
+}
 
-  const type = dv.getUint8(offset);
-  offset += 1;
+/** Pack a single-Trade message (40 bytes) */
+export function packTradeMessage(timestamp: bigint, trade: Trade): Uint8Array {
+  return packSingle(MessageType.TRADE, timestamp, trade, MESSAGE_SIZES.TRADE, packTrade);
+}
 
-  // Unpack u48 timestamp from little-endian
-  let timestamp = 0n;
-  timestamp |= BigInt(dv.getUint8(offset));
-  timestamp |= BigInt(dv.getUint8(offset + 1)) << 8n;
-  timestamp |= BigInt(dv.getUint8(offset + 2)) << 16n;
-  timestamp |= BigInt(dv.getUint8(offset + 3)) << 24n;
-  timestamp |= BigInt(dv.getUint8(offset + 4)) << 32n;
-  timestamp |= BigInt(dv.getUint8(offset + 5)) << 40n;
-  offset += 6;
+/** Pack a single-Order message (40 bytes) */
+export function packOrderMessage(timestamp: bigint, order: Order): Uint8Array {
+  return packSingle(MessageType.ORDER, timestamp, order, MESSAGE_SIZES.ORDER, packOrder);
+}
 
-  const count = dv.getUint8(offset);
-  offset += 1;
+/** Pack a single-Tick message (40 bytes) */
+export function packTickMessage(timestamp: bigint, tick: Tick): Uint8Array {
+  return packSingle(MessageType.TICK, timestamp, tick, MESSAGE_SIZES.TICK, packTick);
+}
+
+// Batch codecs: homogeneous fixed-size bodies are decoded from one view at
+// a constant stride into a preallocated array.
+
+function unpackArray<T>(
+  dv: DataView,
+  offset: number,
+  count: number,
+  size: number,
+  unpack: (dv: DataView, offset: number) => T
+): T[] {
+  const out: T[] = new Array(count);
+  for (let i = 0; i < count; i++) {
+    out[i] = unpack(dv, offset + i * size);
+  }
+  return out;
+}
 
-  const header: MitchHeader = { messageType: type, timestamp, count };
+/** Unpack `count` consecutive Trade bodies */
+export function unpackTrades(dv: DataView, offset: number, count: number): Trade[] {
+  return unpackArray(dv, offset, count, MESSAGE_SIZES.TRADE, unpackTrade);
+}
 
-  let body: any[] = [];
+/** Unpack `count` consecutive Order bodies */
+export function unpackOrders(dv: DataView, offset: number, count: number): Order[] {
+  return unpackArray(dv, offset, count, MESSAGE_SIZES.ORDER, unpackOrder);
+}
 
-  switch (type) {
-    case MessageType.TRADE:
-      for (let i = 0; i < count; i++) {
-        const trade: Trade = {
-          tickerId: dv.getBigUint64(offset, true), // little-endian
-          price: dv.getFloat64(offset + 8, true), // little-endian
-          quantity: dv.getUint32(offset + 16, true), // little-endian
-          tradeId: dv.getUint32(offset + 20, true), // little-endian
-          side: dv.getUint8(offset + 24)
-        };
-        body.push(trade);
-        offset += 32;
-      }
-      break;
+/** Unpack `count` consecutive Tick bodies */
+export function unpackTicks(dv: DataView, offset: number, count: number): Tick[] {
+  return unpackArray(dv, offset, count, MESSAGE_SIZES.TICK, unpackTick);
+}
 
-    case MessageType.ORDER:
-      for (let i = 0; i < count; i++) {
-        const typeAndSide = dv.getUint8(offset + 24);
-        const side = typeAndSide & 0x01;
-        const orderType = (typeAndSide >> 1) & 0x7F;
-
-        // Unpack u48 expiry from little-endian
-        let expiry = 0n;
-        expiry |= BigInt(dv.getUint8(offset + 25));
-        expiry |= BigInt(dv.getUint8(offset + 26)) << 8n;
-        expiry |= BigInt(dv.getUint8(offset + 27)) << 16n;
-        expiry |= BigInt(dv.getUint8(offset + 28)) << 24n;
-        expiry |= BigInt(dv.getUint8(offset + 29)) << 32n;
-        expiry |= BigInt(dv.getUint8(offset + 30)) << 40n;
-
-        const order: Order = {
-          tickerId: dv.getBigUint64(offset, true), // little-endian
-          orderId: dv.getUint32(offset + 8, true), // little-endian
-          price: dv.getFloat64(offset + 12, true), // little-endian
-          quantity: dv.getUint32(offset + 20, true), // little-endian
-          orderType,
-          side,
-          expiry
-        };
-        body.push(order);
-        offset += 32;
-      }
-      break;
+/** Unpack `count` consecutive Index bodies */
+export function unpackIndices(dv: DataView, offset: number, count: number): Index[] {
+  return unpackArray(dv, offset, count, MESSAGE_SIZES.INDEX, unpackIndex);
+}
+
+// Specialized parsers: feeds tend to repeat the same (type, count) pair, so
+// the first message of each pair compiles an unrolled decoder with constant
+// field offsets, cached for reuse. Only small counts are specialized: large
+// unrolled bodies are too big for V8 to optimize and run slower than the
+// generic loop. Decoded bodies still come from the pools.
+// Where code generation is unavailable (e.g. CSP without 'unsafe-eval'),
+// unpackMitchMessage keeps using the generic codecs.
+
+/** Field layout of a fixed-size body: [name, reader, offset] */
+interface UnrolledLayout {
+  size: number;
+  pool: object[];
+  fields: [string, string, number][];
+}
+
+const UNROLLED_LAYOUTS: Record<number, UnrolledLayout> = {
+  [MessageType.TRADE]: {
+    size: MESSAGE_SIZES.TRADE,
+    pool: tradePool,
+    fields: [
+      ['tickerId', 'getBigUint64', 0],
+      ['price', 'getFloat64', 8],
+      ['quantity', 'getUint32', 16],
+      ['tradeId', 'getUint32', 20],
+      ['side', 'getUint8', 24],
+    ],
+  },
+  [MessageType.ORDER]: {
+    size: MESSAGE_SIZES.ORDER,
+    pool: orderPool,
+    fields: [
+      ['tickerId', 'getBigUint64', 0],
+      ['orderId', 'getUint32', 8],
+      ['price', 'getFloat64', 12],
+      ['quantity', 'getUint32', 20],
+      ['typeAndSide', 'getUint8', 24],
+      ['expiry', 'readU48', 25],
+    ],
+  },
+  [MessageType.TICK]: {
+    size: MESSAGE_SIZES.TICK,
+    pool: tickPool,
+    fields: [
+      ['tickerId', 'getBigUint64', 0],
+      ['bidPrice', 'getFloat64', 8],
+      ['askPrice', 'getFloat64', 16],
+      ['bidVolume', 'getUint32', 24],
+      ['askVolume', 'getUint32', 28],
+    ],
+  },
+};
+
+type BodyParser = (dv: DataView, offset: number) => any[];
+
+/** Largest body count that gets an unrolled parser (at most 3 x 16 cached) */
+const MAX_UNROLLED_COUNT = 16;
+const parserCache = new Map<number, BodyParser>();
+let codegenAvailable = true;
+
+function compileParser(layout: UnrolledLayout, count: number): BodyParser {
+  const read = ([, reader, at]: [string, string, number], base: number): string => {
+    const pos = `offset + ${base + at}`;
+    if (reader === 'readU48') return `readU48(dv, ${pos})`;
+    if (reader === 'getUint8') return `dv.getUint8(${pos})`;
+    return `dv.${reader}(${pos}, true)`;
+  };
+
+  let src = `const out = new Array(${count});\nlet b;\n`;
+  for (let i = 0; i < count; i++) {
+    const base = i * layout.size;
+    const literal = layout.fields.map(f => `${f[0]}: ${read(f, base)}`).join(', ');
+    const assigns = layout.fields.map(f => `b.${f[0]} = ${read(f, base)};`).join(' ');
+    src += `b = pool.pop();\n`;
+    src += `if (b === undefined) { out[${i}] = { ${literal} }; } else { pooled.delete(b); ${assigns} out[${i}] = b; }\n`;
+  }
+  src += 'return out;';
 
+  return new Function('pool', 'pooled', 'readU48', `return function (dv, offset) {\n${src}\n};`)(
+    layout.pool, pooled, readU48
+  );
+}
+
+/** Cached unrolled parser for a (type, count) pair, if one can be built */
+function specializedParser(messageType: number, count: number): BodyParser | undefined {
+  const layout = UNROLLED_LAYOUTS[messageType];
+  if (layout === undefined || count > MAX_UNROLLED_COUNT || !codegenAvailable) return undefined;
+
+  const key = (messageType << 8) | count;
+  let parser = parserCache.get(key);
+  if (parser === undefined) {
+    try {
+      parser = compileParser(layout, count);
+    } catch {
+      codegenAvailable = false;
+      return undefined;
+    }
+    parserCache.set(key, parser);
+  }
+  return parser;
+}
+
+// Columnar codecs: bulk feeds decode straight into typed arrays (one column
+// per field) so no per-body object is created. Consumers index columns
+// directly, e.g. `columns.price[i]`.
+
+/** Columnar view of Trade bodies */
+export interface TradeColumns {
+  tickerId: BigUint64Array;
+  price: Float64Array;
+  quantity: Uint32Array;
+  tradeId: Uint32Array;
+  side: Uint8Array;
+}
+
+/** Columnar view of Order bodies */
+export interface OrderColumns {
+  tickerId: BigUint64Array;
+  orderId: Uint32Array;
+  price: Float64Array;
+  quantity: Uint32Array;
+  typeAndSide: Uint8Array;  // type (bits 1-7) and side (bit 0)
+  expiry: BigUint64Array;
+}
+
+/** Columnar view of Tick bodies */
+export interface TickColumns {
+  tickerId: BigUint64Array;
+  bidPrice: Float64Array;
+  askPrice: Float64Array;
+  bidVolume: Uint32Array;
+  askVolume: Uint32Array;
+}
+
+/** Unpack `count` consecutive Trade bodies into columns */
+export function unpackTradeColumns(dv: DataView, offset: number, count: number): TradeColumns {
+  const cols: TradeColumns = {
+    tickerId: new BigUint64Array(count),
+    price: new Float64Array(count),
+    quantity: new Uint32Array(count),
+    tradeId: new Uint32Array(count),
+    side: new Uint8Array(count),
+  };
+  checkBounds(dv, offset, count * MESSAGE_SIZES.TRADE);
+  if (canCast(dv, offset)) {
+    // 32-byte bodies: 4 u64/f64 slots, 8 u32 slots, 32 u8 slots each
+    const base = dv.byteOffset + offset;
+    const u64 = new BigUint64Array(dv.buffer, base, count * 4);
+    const f64 = new Float64Array(dv.buffer, base, count * 4);
+    const u32 = new Uint32Array(dv.buffer, base, count * 8);
+    const u8 = new Uint8Array(dv.buffer, base, count * 32);
+    for (let i = 0; i < count; i++) {
+      cols.tickerId[i] = u64[i * 4];
+      cols.price[i] = f64[i * 4 + 1];
+      cols.quantity[i] = u32[i * 8 + 4];
+      cols.tradeId[i] = u32[i * 8 + 5];
+      cols.side[i] = u8[i * 32 + 24];
+    }
+    return cols;
+  }
+  for (let i = 0; i < count; i++, offset += MESSAGE_SIZES.TRADE) {
+    cols.tickerId[i] = dv.getBigUint64(offset, true); // little-endian
+    cols.price[i] = dv.getFloat64(offset + 8, true); // little-endian
+    cols.quantity[i] = dv.getUint32(offset + 16, true); // little-endian
+    cols.tradeId[i] = dv.getUint32(offset + 20, true); // little-endian
+    cols.side[i] = dv.getUint8(offset + 24);
+  }
+  return cols;
+}
+
+/** Unpack `count` consecutive Order bodies into columns */
+export function unpackOrderColumns(dv: DataView, offset: number, count: number): OrderColumns {
+  const cols: OrderColumns = {
+    tickerId: new BigUint64Array(count),
+    orderId: new Uint32Array(count),
+    price: new Float64Array(count),
+    quantity: new Uint32Array(count),
+    typeAndSide: new Uint8Array(count),
+    expiry: new BigUint64Array(count),
+  };
+  for (let i = 0; i < count; i++, offset += MESSAGE_SIZES.ORDER) {
+    cols.tickerId[i] = dv.getBigUint64(offset, true); // little-endian
+    cols.orderId[i] = dv.getUint32(offset + 8, true); // little-endian
+    cols.price[i] = dv.getFloat64(offset + 12, true); // little-endian
+    cols.quantity[i] = dv.getUint32(offset + 20, true); // little-endian
+    cols.typeAndSide[i] = dv.getUint8(offset + 24);
+    cols.expiry[i] = readU48(dv, offset + 25); // little-endian
+  }
+  return cols;
+}
+
+/** Unpack `count` consecutive Tick bodies into columns */
+export function unpackTickColumns(dv: DataView, offset: number, count: number): TickColumns {
+  const cols: TickColumns = {
+    tickerId: new BigUint64Array(count),
+    bidPrice: new Float64Array(count),
+    askPrice: new Float64Array(count),
+    bidVolume: new Uint32Array(count),
+    askVolume: new Uint32Array(count),
+  };
+  checkBounds(dv, offset, count * MESSAGE_SIZES.TICK);
+  if (canCast(dv, offset)) {
+    // 32-byte bodies: 4 u64/f64 slots, 8 u32 slots each
+    const base = dv.byteOffset + offset;
+    const u64 = new BigUint64Array(dv.buffer, base, count * 4);
+    const f64 = new Float64Array(dv.buffer, base, count * 4);
+    const u32 = new Uint32Array(dv.buffer, base, count * 8);
+    for (let i = 0; i < count; i++) {
+      cols.tickerId[i] = u64[i * 4];
+      cols.bidPrice[i] = f64[i * 4 + 1];
+      cols.askPrice[i] = f64[i * 4 + 2];
+      cols.bidVolume[i] = u32[i * 8 + 6];
+      cols.askVolume[i] = u32[i * 8 + 7];
+    }
+    return cols;
+  }
+  for (let i = 0; i < count; i++, offset += MESSAGE_SIZES.TICK) {
+    cols.tickerId[i] = dv.getBigUint64(offset, true); // little-endian
+    cols.bidPrice[i] = dv.getFloat64(offset + 8, true); // little-endian
+    cols.askPrice[i] = dv.getFloat64(offset + 16, true); // little-endian
+    cols.bidVolume[i] = dv.getUint32(offset + 24, true); // little-endian
+    cols.askVolume[i] = dv.getUint32(offset + 28, true); // little-endian
+  }
+  return cols;
+}
+
+/**
+ * Unpack a Trade, Order or Tick message into columns.
+ * Prefer this over unpackMitchMessage for large counts (bulk feeds).
+ */
+export function unpackMitchColumns(
+  bytes: MitchBytes,
+  offset: number = 0
+): { header: MitchHeader; columns: TradeColumns | OrderColumns | TickColumns } {
+  const dv = viewOf(bytes);
+  const header = unpackHeader(dv, offset);
+  offset += MESSAGE_SIZES.HEADER;
+
+  switch (header.messageType) {
+    case MessageType.TRADE:
+      return { header, columns: unpackTradeColumns(dv, offset, header.count) };
+    case MessageType.ORDER:
+      return { header, columns: unpackOrderColumns(dv, offset, header.count) };
     case MessageType.TICK:
-      for (let i = 0; i < count; i++) {
-        const tick: Tick = {
-          tickerId: dv.getBigUint64(offset, true), // little-endian
-          bidPrice: dv.getFloat64(offset + 8, true), // little-endian
-          askPrice: dv.getFloat64(offset + 16, true), // little-endian
-          bidVolume: dv.getUint32(offset + 24, true), // little-endian
-          askVolume: dv.getUint32(offset + 28, true) // little-endian
-        };
-        body.push(tick);
-        offset += 32;
-      }
-      break;
-
-    case MessageType.ORDER_BOOK:
-      for (let i = 0; i < count; i++) {
-        const tickerId = dv.getBigUint64(offset, true); // little-endian
-        const midPrice = dv.getFloat64(offset + 8, true); // little-endian
-        const binAggregator = dv.getUint8(offset + 16); // little-endian
-        offset += 17; // skip header and padding
-
-        let bids: Bin[] = [];
-        for (let j = 0; j < 128; j++) { // Assuming 128 bid levels
-          bids.push({ count: dv.getUint32(offset, true), volume: dv.getUint32(offset + 4, true) }); // little-endian
-          offset += 8;
-        }
-
-        let asks: Bin[] = [];
-        for (let j = 0; j < 128; j++) { // Assuming 128 ask levels
-          asks.push({ count: dv.getUint32(offset, true), volume: dv.getUint32(offset + 4, true) }); // little-endian
-          offset += 8;
-        }
-
-        body.push({
-          tickerId,
-          midPrice,
-          binAggregator,
-          bids,
-          asks
-        });
-      }
-      break;
-
-    case MessageType.INDEX:
-      for (let i = 0; i < count; i++) {
-        const index: Index = {
-          tickerId: dv.getBigUint64(offset, true), // little-endian
-          mid: dv.getFloat64(offset + 8, true), // little-endian
-          vbid: dv.getUint32(offset + 16, true), // little-endian
-          vask: dv.getUint32(offset + 20, true), // little-endian
-          mspread: dv.getInt32(offset + 24, true), // little-endian
-          bbido: dv.getInt32(offset + 28, true), // little-endian
-          basko: dv.getInt32(offset + 32, true), // little-endian
-          wbido: dv.getInt32(offset + 36, true), // little-endian
-          wasko: dv.getInt32(offset + 40, true), // little-endian
-          vforce: dv.getUint16(offset + 44, true), // little-endian
-          lforce: dv.getUint16(offset + 46, true), // little-endian
-          tforce: dv.getInt16(offset + 48, true), // little-endian
-          mforce: dv.getInt16(offset + 50, true), // little-endian
-          confidence: dv.getUint8(offset + 52),
-          rejected: dv.getUint8(offset + 53),
-          accepted: dv.getUint8(offset + 54)
-        };
-        body.push(index);
-        offset += 64;
-      }
-      break;
+      return { header, columns: unpackTickColumns(dv, offset, header.count) };
+    default:
+      throw new Error(`Columnar decoding not supported for message type ${header.messageType}`);
+  }
+}
+
+/**
+ * Unpack a MITCH message starting at `offset` within `bytes`.
+ * Reads through a DataView over the caller's memory: no slicing or copying,
+ * and views into larger buffers (e.g. pooled Node Buffers) are handled.
+ */
+export function unpackMitchMessage(bytes: MitchBytes, offset: number = 0): MitchMessage {
+  const dv = viewOf(bytes);
+  const header = unpackHeader(dv, offset);
+  offset += MESSAGE_SIZES.HEADER;
+
+  const parser = specializedParser(header.messageType, header.count);
+  if (parser !== undefined) {
+    return { header, body: parser(dv, offset) };
   }
 
+  const codec = bodyCodec(header.messageType);
+  const body = unpackArray(dv, offset, header.count, codec.size, codec.unpack);
+
   return { header, body };
 }
+
+// =============================================================================
+// LAYOUT CHECKS
+// =============================================================================
+
+// Every codec and the typed-array fast paths assume the MESSAGE_SIZES layouts:
+// check at load time that each packer writes exactly its declared size, so a
+// layout change fails on import rather than corrupting messages under load.
+(() => {
+  const dv = new DataView(new ArrayBuffer(MESSAGE_SIZES.ORDER_BOOK));
+  const bins = (): Uint32Array => new Uint32Array(ORDER_BOOK_BINS * 2);
+  const checks: [string, number, number][] = [
+    ['header', packHeader(dv, 0, { messageType: MessageType.TRADE, timestamp: 0n, count: 1 }), MESSAGE_SIZES.HEADER],
+    ['trade', packTrade(dv, 0, { tickerId: 0n, price: 0, quantity: 0, tradeId: 0, side: OrderSide.BUY }), MESSAGE_SIZES.TRADE],
+    ['order', packOrder(dv, 0, { tickerId: 0n, orderId: 0, price: 0, quantity: 0, typeAndSide: 0, expiry: 0n }), MESSAGE_SIZES.ORDER],
+    ['tick', packTick(dv, 0, { tickerId: 0n, bidPrice: 0, askPrice: 0, bidVolume: 0, askVolume: 0 }), MESSAGE_SIZES.TICK],
+    ['index', packIndex(dv, 0, {
+      tickerId: 0n, mid: 0, vbid: 0, vask: 0, mspread: 0, bbido: 0, basko: 0, wbido: 0, wasko: 0,
+      vforce: 0, lforce: 0, tforce: 0, mforce: 0, confidence: 0, rejected: 0, accepted: 0,
+    }), MESSAGE_SIZES.INDEX],
+    ['order book', packOrderBook(dv, 0, {
+      tickerId: 0n, midPrice: 0, binAggregator: BinAggregator.DEFAULT_LINGAUSSIAN, bids: bins(), asks: bins(),
+    }), MESSAGE_SIZES.ORDER_BOOK],
+  ];
+  for (const [name, actual, expected] of checks) {
+    if (actual !== expected) {
+      throw new Error(`MITCH ${name} layout is ${actual} bytes, expected ${expected}`);
+    }
+  }
+})();